@@ -1,8 +1,15 @@
+from functools import lru_cache
+
+_KW_TEMPLATES = (
+    "best {t}",
+    "{t} review",
+    "buy {t} online",
+    "{t} price"
+)
+
+
+@lru_cache(maxsize=4096)
 def generate_keywords(product_title):
+    """Return the keyword phrases for a title as a cached, immutable tuple."""
     title = product_title.lower()
-    return [
-        f"best {title}",
-        f"{title} review",
-        f"buy {title} online",
-        f"{title} price"
-    ]
+    return tuple(tmpl.format(t=title) for tmpl in _KW_TEMPLATES)